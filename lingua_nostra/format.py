@@ -21,8 +21,6 @@ from collections import namedtuple
 from os.path import join
 from warnings import warn
 
-from quantulum3 import parser as quantity_parser
-
 from lingua_nostra.bracket_expansion import SentenceTreeParser
 from lingua_nostra.internal import localized_function, \
     populate_localized_function_dict, get_active_langs, \
@@ -61,6 +59,8 @@ def nice_units(utterance=None, lang=''):
     """
     lang = get_primary_lang_code(lang)
     pronounced_units = []
+    # quantulum3 is slow to import, only load it when units are needed
+    from quantulum3 import parser as quantity_parser
 
     try:
         quants = quantity_parser.parse(utterance, lang)
@@ -88,6 +88,7 @@ def expand_units(text, lang=""):
             (str): A text with fully de-abbreviated units
     """
     lang = get_primary_lang_code(lang)
+    from quantulum3 import parser as quantity_parser
     try:
         return quantity_parser.inline_parse_and_expand(text, lang)
     except NotImplementedError:
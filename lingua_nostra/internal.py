@@ -41,6 +41,9 @@ __active_lang_code = None
 __loaded_langs = []
 
 _localized_functions = {}
+# {(module_name, language_code): {function_name: signature}}, language
+# modules are only inspected the first time they are loaded
+_localized_signatures = {}
 
 # TODO the deprecation of 'lang=None' and 'lang=<invalid>' can refer to
 # commit 35efd0661a178e82f6745ad17e10e607c0d83472 for the "proper" state
@@ -450,14 +453,17 @@ def localized_function(run_own_code_on=[type(None)]):
 
     # Begin wrapper
     def localized_function_decorator(func):
+        # These only depend on the wrapped function, look them up once
+        # rather than on every call
+        lang_param_index = list(signature(func).parameters).index('lang')
+        _module_name = func.__module__.split('.')[-1]
+        func_name = func.__name__.split('.')[-1]
+
         # Wrapper's logic
         def _call_localized_function(func, *args, **kwargs):
             lang_code = None
             load_langs_on_demand = config.load_langs_on_demand
             unload_language_afterward = False
-            func_signature = signature(func)
-            func_params = list(func_signature.parameters)
-            lang_param_index = func_params.index('lang')
             full_lang_code = None
 
             # Check if we need to add timezone awareness to any datetime object
@@ -530,7 +536,6 @@ def localized_function(run_own_code_on=[type(None)]):
                 full_lang_code = get_full_lang_code(lang_code)
 
             # Here comes the ugly business.
-            _module_name = func.__module__.split('.')[-1]
             _module = import_module(".lang." + _module_name +
                                     "_" + lang_code, "lingua_nostra")
             # The nonsense above gets you from lingua_nostra.parse
@@ -547,7 +552,6 @@ def localized_function(run_own_code_on=[type(None)]):
                                               " module of language '" +
                                               lang_code +
                                               "' is not currently loaded.")
-            func_name = func.__name__.split('.')[-1]
             # At some point in the past, both the module and the language
             # were imported/loaded, respectively.
             # When that happened, we cached the *signature* of each
@@ -650,6 +654,10 @@ def populate_localized_function_dict(lf_module, langs=get_active_langs()):
     return_dict = {}
     for lang_code in langs:
         primary_lang_code = get_primary_lang_code(lang_code)
+        cached = _localized_signatures.get((lf_module, primary_lang_code))
+        if cached is not None:
+            return_dict[primary_lang_code] = cached
+            continue
         return_dict[primary_lang_code] = {}
         _FUNCTION_NOT_FOUND = ""
         try:
@@ -688,6 +696,8 @@ def populate_localized_function_dict(lf_module, langs=get_active_langs()):
             return_dict[primary_lang_code][function_name] = function_signature
 
         del mod
+        _localized_signatures[(lf_module, primary_lang_code)] = \
+            return_dict[primary_lang_code]
     _localized_functions[lf_module] = return_dict
     return _localized_functions[lf_module]
 
@@ -13,12 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from collections import OrderedDict
+from sys import intern
 from .parse_common import invert_dict
 
 _FUNCTION_NOT_IMPLEMENTED_WARNING = "The requested function is not implemented in English."
 
-_ARTICLES_EN = {'a', 'an', 'the'}
+_ARTICLES_EN = frozenset({'a', 'an', 'the'})
 
 
 _NUM_STRING_EN = {
@@ -76,109 +76,109 @@ _FRACTION_STRING_EN = {
 }
 
 
-_LONG_SCALE_EN = OrderedDict([
-    (100, 'hundred'),
-    (1000, 'thousand'),
-    (1000000, 'million'),
-    (1e12, "billion"),
-    (1e18, 'trillion'),
-    (1e24, "quadrillion"),
-    (1e30, "quintillion"),
-    (1e36, "sextillion"),
-    (1e42, "septillion"),
-    (1e48, "octillion"),
-    (1e54, "nonillion"),
-    (1e60, "decillion"),
-    (1e66, "undecillion"),
-    (1e72, "duodecillion"),
-    (1e78, "tredecillion"),
-    (1e84, "quattuordecillion"),
-    (1e90, "quinquadecillion"),
-    (1e96, "sedecillion"),
-    (1e102, "septendecillion"),
-    (1e108, "octodecillion"),
-    (1e114, "novendecillion"),
-    (1e120, "vigintillion"),
-    (1e306, "unquinquagintillion"),
-    (1e312, "duoquinquagintillion"),
-    (1e336, "sesquinquagintillion"),
-    (1e366, "unsexagintillion")
-])
-
-
-_SHORT_SCALE_EN = OrderedDict([
-    (100, 'hundred'),
-    (1000, 'thousand'),
-    (1000000, 'million'),
-    (1e9, "billion"),
-    (1e12, 'trillion'),
-    (1e15, "quadrillion"),
-    (1e18, "quintillion"),
-    (1e21, "sextillion"),
-    (1e24, "septillion"),
-    (1e27, "octillion"),
-    (1e30, "nonillion"),
-    (1e33, "decillion"),
-    (1e36, "undecillion"),
-    (1e39, "duodecillion"),
-    (1e42, "tredecillion"),
-    (1e45, "quattuordecillion"),
-    (1e48, "quinquadecillion"),
-    (1e51, "sedecillion"),
-    (1e54, "septendecillion"),
-    (1e57, "octodecillion"),
-    (1e60, "novendecillion"),
-    (1e63, "vigintillion"),
-    (1e66, "unvigintillion"),
-    (1e69, "uuovigintillion"),
-    (1e72, "tresvigintillion"),
-    (1e75, "quattuorvigintillion"),
-    (1e78, "quinquavigintillion"),
-    (1e81, "qesvigintillion"),
-    (1e84, "septemvigintillion"),
-    (1e87, "octovigintillion"),
-    (1e90, "novemvigintillion"),
-    (1e93, "trigintillion"),
-    (1e96, "untrigintillion"),
-    (1e99, "duotrigintillion"),
-    (1e102, "trestrigintillion"),
-    (1e105, "quattuortrigintillion"),
-    (1e108, "quinquatrigintillion"),
-    (1e111, "sestrigintillion"),
-    (1e114, "septentrigintillion"),
-    (1e117, "octotrigintillion"),
-    (1e120, "noventrigintillion"),
-    (1e123, "quadragintillion"),
-    (1e153, "quinquagintillion"),
-    (1e183, "sexagintillion"),
-    (1e213, "septuagintillion"),
-    (1e243, "octogintillion"),
-    (1e273, "nonagintillion"),
-    (1e303, "centillion"),
-    (1e306, "uncentillion"),
-    (1e309, "duocentillion"),
-    (1e312, "trescentillion"),
-    (1e333, "decicentillion"),
-    (1e336, "undecicentillion"),
-    (1e363, "viginticentillion"),
-    (1e366, "unviginticentillion"),
-    (1e393, "trigintacentillion"),
-    (1e423, "quadragintacentillion"),
-    (1e453, "quinquagintacentillion"),
-    (1e483, "sexagintacentillion"),
-    (1e513, "septuagintacentillion"),
-    (1e543, "ctogintacentillion"),
-    (1e573, "nonagintacentillion"),
-    (1e603, "ducentillion"),
-    (1e903, "trecentillion"),
-    (1e1203, "quadringentillion"),
-    (1e1503, "quingentillion"),
-    (1e1803, "sescentillion"),
-    (1e2103, "septingentillion"),
-    (1e2403, "octingentillion"),
-    (1e2703, "nongentillion"),
-    (1e3003, "millinillion")
-])
+_LONG_SCALE_EN = {
+    100: 'hundred',
+    1000: 'thousand',
+    1000000: 'million',
+    1e12: "billion",
+    1e18: 'trillion',
+    1e24: "quadrillion",
+    1e30: "quintillion",
+    1e36: "sextillion",
+    1e42: "septillion",
+    1e48: "octillion",
+    1e54: "nonillion",
+    1e60: "decillion",
+    1e66: "undecillion",
+    1e72: "duodecillion",
+    1e78: "tredecillion",
+    1e84: "quattuordecillion",
+    1e90: "quinquadecillion",
+    1e96: "sedecillion",
+    1e102: "septendecillion",
+    1e108: "octodecillion",
+    1e114: "novendecillion",
+    1e120: "vigintillion",
+    1e306: "unquinquagintillion",
+    1e312: "duoquinquagintillion",
+    1e336: "sesquinquagintillion",
+    1e366: "unsexagintillion"
+}
+
+
+_SHORT_SCALE_EN = {
+    100: 'hundred',
+    1000: 'thousand',
+    1000000: 'million',
+    1e9: "billion",
+    1e12: 'trillion',
+    1e15: "quadrillion",
+    1e18: "quintillion",
+    1e21: "sextillion",
+    1e24: "septillion",
+    1e27: "octillion",
+    1e30: "nonillion",
+    1e33: "decillion",
+    1e36: "undecillion",
+    1e39: "duodecillion",
+    1e42: "tredecillion",
+    1e45: "quattuordecillion",
+    1e48: "quinquadecillion",
+    1e51: "sedecillion",
+    1e54: "septendecillion",
+    1e57: "octodecillion",
+    1e60: "novendecillion",
+    1e63: "vigintillion",
+    1e66: "unvigintillion",
+    1e69: "uuovigintillion",
+    1e72: "tresvigintillion",
+    1e75: "quattuorvigintillion",
+    1e78: "quinquavigintillion",
+    1e81: "qesvigintillion",
+    1e84: "septemvigintillion",
+    1e87: "octovigintillion",
+    1e90: "novemvigintillion",
+    1e93: "trigintillion",
+    1e96: "untrigintillion",
+    1e99: "duotrigintillion",
+    1e102: "trestrigintillion",
+    1e105: "quattuortrigintillion",
+    1e108: "quinquatrigintillion",
+    1e111: "sestrigintillion",
+    1e114: "septentrigintillion",
+    1e117: "octotrigintillion",
+    1e120: "noventrigintillion",
+    1e123: "quadragintillion",
+    1e153: "quinquagintillion",
+    1e183: "sexagintillion",
+    1e213: "septuagintillion",
+    1e243: "octogintillion",
+    1e273: "nonagintillion",
+    1e303: "centillion",
+    1e306: "uncentillion",
+    1e309: "duocentillion",
+    1e312: "trescentillion",
+    1e333: "decicentillion",
+    1e336: "undecicentillion",
+    1e363: "viginticentillion",
+    1e366: "unviginticentillion",
+    1e393: "trigintacentillion",
+    1e423: "quadragintacentillion",
+    1e453: "quinquagintacentillion",
+    1e483: "sexagintacentillion",
+    1e513: "septuagintacentillion",
+    1e543: "ctogintacentillion",
+    1e573: "nonagintacentillion",
+    1e603: "ducentillion",
+    1e903: "trecentillion",
+    1e1203: "quadringentillion",
+    1e1503: "quingentillion",
+    1e1803: "sescentillion",
+    1e2103: "septingentillion",
+    1e2403: "octingentillion",
+    1e2703: "nongentillion",
+    1e3003: "millinillion"
+}
 
 
 _ORDINAL_BASE_EN = {
@@ -246,47 +246,70 @@ _LONG_ORDINAL_EN = {
 _LONG_ORDINAL_EN.update(_ORDINAL_BASE_EN)
 
 
+# fraction word -> denominator, e.g. "quarter" -> 4, "fifth" -> 5
+def _generate_fraction_denominators_en(ordinals):
+    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
+    for num in ordinals:
+        if num > 2:
+            fracts[ordinals[num]] = num
+    return fracts
+
+
+_SHORT_FRACTION_DENOMINATORS_EN = \
+    _generate_fraction_denominators_en(_SHORT_ORDINAL_EN)
+_LONG_FRACTION_DENOMINATORS_EN = \
+    _generate_fraction_denominators_en(_LONG_ORDINAL_EN)
+
+
 # negate next number (-2 = 0 - 2)
-_NEGATIVES_EN = {"negative", "minus"}
+_NEGATIVES_EN = frozenset({"negative", "minus"})
+
+# words that may lead a number without being part of its value
+_ARTICLES_AND_NEGATIVES_EN = _ARTICLES_EN | _NEGATIVES_EN
 
 # sum the next number (twenty two = 20 + 2)
-_SUMS_EN = {'twenty', '20', 'thirty', '30', 'forty', '40', 'fifty', '50',
-            'sixty', '60', 'seventy', '70', 'eighty', '80', 'ninety', '90'}
+_SUMS_EN = frozenset({'twenty', '20', 'thirty', '30', 'forty', '40',
+                      'fifty', '50', 'sixty', '60', 'seventy', '70',
+                      'eighty', '80', 'ninety', '90'})
 
 
-def _generate_plurals_en(originals):
+def _invert_with_plurals_en(original):
     """
-    Return a new set or dict containing the plural form of the original values,
+    Invert a number -> word dict, adding the plural of every word.
 
-    In English this means all with 's' appended to them.
+    In English the plural is the word with 's' appended to it.
 
     Args:
-        originals set(str) or dict(str, any): values to pluralize
+        original dict(any, str): words to invert
 
     Returns:
-        set(str) or dict(str, any)
+        dict(str, any)
 
     """
     # TODO migrate to https://github.com/MycroftAI/lingua-franca/pull/36
-    if isinstance(originals, dict):
-        return {key + 's': value for key, value in originals.items()}
-    return {value + "s" for value in originals}
+    # interned so the short and long scale tables share their plurals
+    inverted = {}
+    for key, word in original.items():
+        inverted[word] = key
+        inverted[intern(word + "s")] = key
+    return inverted
 
 
-_MULTIPLIES_LONG_SCALE_EN = set(_LONG_SCALE_EN.values()) | \
-    _generate_plurals_en(_LONG_SCALE_EN.values())
+_STRING_SHORT_SCALE_EN = _invert_with_plurals_en(_SHORT_SCALE_EN)
+_STRING_LONG_SCALE_EN = _invert_with_plurals_en(_LONG_SCALE_EN)
 
-_MULTIPLIES_SHORT_SCALE_EN = set(_SHORT_SCALE_EN.values()) | \
-    _generate_plurals_en(_SHORT_SCALE_EN.values())
+# scale words and their plurals, sharing the strings of the maps above
+_MULTIPLIES_LONG_SCALE_EN = frozenset(_STRING_LONG_SCALE_EN)
+
+_MULTIPLIES_SHORT_SCALE_EN = frozenset(_STRING_SHORT_SCALE_EN)
 
 # split sentence parse separately and sum ( 2 and a half = 2 + 0.5 )
-_FRACTION_MARKER_EN = {"and"}
+_FRACTION_MARKER_EN = frozenset({"and"})
 
 # decimal marker ( 1 point 5 = 1 + 0.5)
-_DECIMAL_MARKER_EN = {"point", "dot"}
+_DECIMAL_MARKER_EN = frozenset({"point", "dot"})
 
-_STRING_NUM_EN = invert_dict(_NUM_STRING_EN)
-_STRING_NUM_EN.update(_generate_plurals_en(_STRING_NUM_EN))
+_STRING_NUM_EN = _invert_with_plurals_en(_NUM_STRING_EN)
 
 _SPOKEN_EXTRA_NUM_EN = {
             "half": 0.5,
@@ -295,3 +318,19 @@ _SPOKEN_EXTRA_NUM_EN = {
         }
 _STRING_SHORT_ORDINAL_EN = invert_dict(_SHORT_ORDINAL_EN)
 _STRING_LONG_ORDINAL_EN = invert_dict(_LONG_ORDINAL_EN)
+
+# scale words plus the extra spoken numbers, e.g. "half", "couple"
+_STRING_SPOKEN_SHORT_SCALE_EN = dict(_STRING_SHORT_SCALE_EN,
+                                     **_SPOKEN_EXTRA_NUM_EN)
+_STRING_SPOKEN_LONG_SCALE_EN = dict(_STRING_LONG_SCALE_EN,
+                                    **_SPOKEN_EXTRA_NUM_EN)
+
+# every word that names a number, checked with a single lookup while parsing
+_NUMBER_WORDS_SHORT_SCALE_EN = frozenset(_STRING_SHORT_SCALE_EN).union(
+    _STRING_NUM_EN, _SUMS_EN)
+_NUMBER_WORDS_LONG_SCALE_EN = frozenset(_STRING_LONG_SCALE_EN).union(
+    _STRING_NUM_EN, _SUMS_EN)
+_NUMBER_WORDS_SPOKEN_SHORT_SCALE_EN = _NUMBER_WORDS_SHORT_SCALE_EN.union(
+    _SPOKEN_EXTRA_NUM_EN)
+_NUMBER_WORDS_SPOKEN_LONG_SCALE_EN = _NUMBER_WORDS_LONG_SCALE_EN.union(
+    _SPOKEN_EXTRA_NUM_EN)
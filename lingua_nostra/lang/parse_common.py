@@ -18,6 +18,10 @@ import re
 
 ROMAN_NUMERALS = {'I': 1, 'V': 5, 'X': 10, 'L': 50, 'C': 100, 'D': 500, 'M': 1000}
 
+_PERCENT_RE = re.compile(r"([0-9]+)([\%])")
+_HASH_NUMBER_RE = re.compile(r"(\#)([0-9]+\b)")
+_TRAILING_HYPHEN_RE = re.compile(r'- *$')
+
 
 class Normalizer:
     """
@@ -33,9 +37,9 @@ class Normalizer:
     @staticmethod
     def tokenize(utterance):
         # Split things like 12%
-        utterance = re.sub(r"([0-9]+)([\%])", r"\1 \2", utterance)
+        utterance = _PERCENT_RE.sub(r"\1 \2", utterance)
         # Split thins like #1
-        utterance = re.sub(r"(\#)([0-9]+\b)", r"\1 \2", utterance)
+        utterance = _HASH_NUMBER_RE.sub(r"\1 \2", utterance)
         return utterance.split()
 
     @property
@@ -110,40 +114,44 @@ class Normalizer:
 
     def expand_contractions(self, utterance):
         """ Expand common contractions, e.g. "isn't" -> "is not" """
+        contractions = self.contractions
         words = self.tokenize(utterance)
         for idx, w in enumerate(words):
-            if w in self.contractions:
-                words[idx] = self.contractions[w]
+            if w in contractions:
+                words[idx] = contractions[w]
         utterance = " ".join(words)
         return utterance
 
     def numbers_to_digits(self, utterance):
+        number_replacements = self.number_replacements
         words = self.tokenize(utterance)
         for idx, w in enumerate(words):
-            if w in self.number_replacements:
-                words[idx] = self.number_replacements[w]
+            if w in number_replacements:
+                words[idx] = number_replacements[w]
         utterance = " ".join(words)
         return utterance
 
     def remove_articles(self, utterance):
+        articles = set(self.articles)
         words = self.tokenize(utterance)
         for idx, w in enumerate(words):
-            if w in self.articles:
+            if w in articles:
                 words[idx] = ""
         utterance = " ".join(words)
         return utterance
 
     def remove_stopwords(self, utterance):
+        stopwords = set(self.stopwords)
         words = self.tokenize(utterance)
         for idx, w in enumerate(words):
-            if w in self.stopwords:
+            if w in stopwords:
                 words[idx] = ""
         # if words[-1] == '-':
         #    words = words[:-1]
         utterance = " ".join(words)
         # Remove trailing whitespaces from utterance along with orphaned
         # hyphens, more characters may be added later
-        utterance = re.sub(r'- *$', '', utterance)
+        utterance = _TRAILING_HYPHEN_RE.sub('', utterance)
         return utterance
 
     def remove_symbols(self, utterance):
@@ -152,15 +160,16 @@ class Normalizer:
         return utterance
 
     def remove_accents(self, utterance):
-        for s in self.accents:
-            utterance = utterance.replace(s, self.accents[s])
+        for s, replacement in self.accents.items():
+            utterance = utterance.replace(s, replacement)
         return utterance
 
     def replace_words(self, utterance):
+        word_replacements = self.word_replacements
         words = self.tokenize(utterance)
         for idx, w in enumerate(words):
-            if w in self.word_replacements:
-                words[idx] = self.word_replacements[w]
+            if w in word_replacements:
+                words[idx] = word_replacements[w]
         utterance = " ".join(words)
         return utterance
 
@@ -180,13 +189,13 @@ class Normalizer:
         if self.should_remove_accents:
             utterance = self.remove_accents(utterance)
         # TODO deprecate remove_articles param, backwards compat
-        if remove_articles is not None and remove_articles:
-            utterance = self.remove_articles(utterance)
-        elif self.should_remove_articles:
+        if remove_articles or self.should_remove_articles:
             utterance = self.remove_articles(utterance)
         if self.should_remove_stopwords:
             utterance = self.remove_stopwords(utterance)
-        # remove extra spaces
+        # remove extra spaces, usually there are none between the words
+        if "  " not in utterance:
+            return utterance.strip(" ")
         utterance = " ".join([w for w in utterance.split(" ") if w])
         return utterance
 
@@ -207,6 +216,8 @@ class ReplaceableNumber:
     In other words, it is the text, and the number that can replace it in
     the string.
     """
+    # many are created while parsing, a slot per field keeps them small
+    __slots__ = ("value", "tokens")
 
     def __init__(self, value, tokens: [Token]):
         self.value = value
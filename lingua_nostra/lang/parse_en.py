@@ -14,18 +14,24 @@
 # limitations under the License.
 #
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from dateutil.relativedelta import relativedelta
 
 from lingua_nostra.time import now_local
 from lingua_nostra.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    ReplaceableNumber, partition_list, tokenize, Token, Normalizer
 from lingua_nostra.lang.common_data_en import _ARTICLES_EN, _NUM_STRING_EN, \
-    _LONG_ORDINAL_EN, _LONG_SCALE_EN, _SHORT_SCALE_EN, _SHORT_ORDINAL_EN, \
     _NEGATIVES_EN, _SUMS_EN, _MULTIPLIES_LONG_SCALE_EN, \
     _MULTIPLIES_SHORT_SCALE_EN, _FRACTION_MARKER_EN, _DECIMAL_MARKER_EN, \
     _STRING_NUM_EN, _STRING_SHORT_ORDINAL_EN, _STRING_LONG_ORDINAL_EN, \
-    _FRACTION_STRING_EN, _generate_plurals_en, _SPOKEN_EXTRA_NUM_EN
+    _FRACTION_STRING_EN, _SPOKEN_EXTRA_NUM_EN, \
+    _STRING_SHORT_SCALE_EN, _STRING_LONG_SCALE_EN, \
+    _STRING_SPOKEN_SHORT_SCALE_EN, _STRING_SPOKEN_LONG_SCALE_EN, \
+    _NUMBER_WORDS_SHORT_SCALE_EN, _NUMBER_WORDS_LONG_SCALE_EN, \
+    _NUMBER_WORDS_SPOKEN_SHORT_SCALE_EN, _NUMBER_WORDS_SPOKEN_LONG_SCALE_EN, \
+    _ARTICLES_AND_NEGATIVES_EN, _SHORT_FRACTION_DENOMINATORS_EN, \
+    _LONG_FRACTION_DENOMINATORS_EN
 
 import re
 import json
@@ -276,7 +282,16 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
     """
     multiplies, string_num_ordinal, string_num_scale = \
         _initialize_number_data_en(short_scale, speech=ordinals is not None)
+    # union of string_num_scale, _STRING_NUM_EN, _SUMS_EN and multiplies
+    if ordinals is not None:
+        number_vocabulary = _NUMBER_WORDS_SPOKEN_SHORT_SCALE_EN \
+            if short_scale else _NUMBER_WORDS_SPOKEN_LONG_SCALE_EN
+    else:
+        number_vocabulary = _NUMBER_WORDS_SHORT_SCALE_EN if short_scale \
+            else _NUMBER_WORDS_LONG_SCALE_EN
 
+    # lowercased words, kept in step with tokens
+    words = [token.word.lower() for token in tokens]
     number_words = []  # type: [Token]
     val = False
     prev_val = None
@@ -288,13 +303,13 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
             next_val = None
             continue
 
-        word = token.word.lower()
-        if word in _ARTICLES_EN or word in _NEGATIVES_EN:
+        word = words[idx]
+        if word in _ARTICLES_AND_NEGATIVES_EN:
             number_words.append(token)
             continue
 
-        prev_word = tokens[idx - 1].word.lower() if idx > 0 else ""
-        next_word = tokens[idx + 1].word.lower() if idx + 1 < len(tokens) else ""
+        prev_word = words[idx - 1] if idx > 0 else ""
+        next_word = words[idx + 1] if idx + 1 < len(words) else ""
 
         if is_numeric(word[:-2]) and \
                 (word.endswith("st") or word.endswith("nd") or
@@ -307,22 +322,18 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
             if next_word == "one":
                 # would return 1 instead otherwise
                 tokens[idx + 1] = Token("", idx)
-                next_word = ""
+                words[idx + 1] = next_word = ""
 
         # TODO replaces the wall of "and" and "or" with all() or any() as
         #  appropriate, the whole codebase should be checked for this pattern
-        if word not in string_num_scale and \
-                word not in _STRING_NUM_EN and \
-                word not in _SUMS_EN and \
-                word not in multiplies and \
+        if word not in number_vocabulary and \
                 not (ordinals and word in string_num_ordinal) and \
                 not is_numeric(word) and \
                 not is_fractional_en(word, short_scale=short_scale) and \
                 not look_for_fractions(word.split('/')):
-            words_only = [token.word for token in number_words]
-
-            if number_words and not all([w.lower() in _ARTICLES_EN |
-                                         _NEGATIVES_EN for w in words_only]):
+            if number_words and not all(
+                    t.word.lower() in _ARTICLES_AND_NEGATIVES_EN
+                    for t in number_words):
                 break
             else:
                 number_words = []
@@ -482,9 +493,9 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
                 # 9907657
 
                 time_to_sum = True
-                for other_token in tokens[idx+1:]:
-                    if other_token.word.lower() in multiplies:
-                        if string_num_scale[other_token.word.lower()] >= current_val:
+                for other_word in words[idx+1:]:
+                    if other_word in multiplies:
+                        if string_num_scale[other_word] >= current_val:
                             time_to_sum = False
                         else:
                             continue
@@ -522,15 +533,18 @@ def _initialize_number_data_en(short_scale, speech=True):
     string_num_ordinal_en = _STRING_SHORT_ORDINAL_EN if short_scale \
         else _STRING_LONG_ORDINAL_EN
 
-    string_num_scale_en = _SHORT_SCALE_EN if short_scale else _LONG_SCALE_EN
-    string_num_scale_en = invert_dict(string_num_scale_en)
-    string_num_scale_en.update(_generate_plurals_en(string_num_scale_en))
-
+    # the word -> number maps are built once in common_data_en and shared,
+    # callers must not modify them
     if speech:
-        string_num_scale_en.update(_SPOKEN_EXTRA_NUM_EN)
+        string_num_scale_en = _STRING_SPOKEN_SHORT_SCALE_EN if short_scale \
+            else _STRING_SPOKEN_LONG_SCALE_EN
+    else:
+        string_num_scale_en = _STRING_SHORT_SCALE_EN if short_scale \
+            else _STRING_LONG_SCALE_EN
     return multiplies, string_num_ordinal_en, string_num_scale_en
 
 
+@lru_cache(maxsize=2048)
 def extract_number_en(text, short_scale=True, ordinals=False, decimal='.'):
     """
     This function extracts a number from a text string,
@@ -557,6 +571,12 @@ def extract_number_en(text, short_scale=True, ordinals=False, decimal='.'):
                                         short_scale, ordinals).value
 
 
+# "<digits> <unit>", the unit is captured without its plural 's'
+_DURATION_EN = re.compile(
+    r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-)(?P<unit>microsecond|millisecond|"
+    r"second|minute|hour|day|week)s?")
+
+
 def extract_duration_en(text):
     """
     Convert an english phrase into a number of seconds
@@ -586,6 +606,14 @@ def extract_duration_en(text):
     if not text:
         return None
 
+    simple = _DURATION_EN.fullmatch(text)
+    if simple:
+        # no number words to convert and nothing left over
+        value = float(simple.group("value"))
+        if not value:
+            return (None, "")
+        return (timedelta(**{simple.group("unit") + "s": value}), "")
+
     time_units = {
         'microseconds': 0,
         'milliseconds': 0,
@@ -596,16 +624,12 @@ def extract_duration_en(text):
         'weeks': 0
     }
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}s?"
     text = _convert_words_to_numbers_en(text)
 
-    for unit_en in time_units:
-        unit_pattern = pattern.format(unit=unit_en[:-1])   # remove 's' from unit
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
+    def repl(match):
+        time_units[match.group("unit") + "s"] += float(match.group("value"))
+        return ''
+    text = _DURATION_EN.sub(repl, text)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -644,6 +668,25 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                          date or time related text was found.
     """
 
+    if not anchorDate:
+        # "now" moves between calls, only explicit anchors are cached
+        return _extract_datetime_en(text, now_local(), default_time)
+    # datetimes in different timezones can compare equal, key on the
+    # tzinfo too so each timezone gets its own result
+    extracted = _extract_datetime_cached_en(text, anchorDate,
+                                            id(anchorDate.tzinfo),
+                                            default_time)
+    return list(extracted) if extracted else None
+
+
+@lru_cache(maxsize=1024)
+def _extract_datetime_cached_en(text, anchorDate, tz_id, default_time):
+    extracted = _extract_datetime_en(text, anchorDate, default_time)
+    return tuple(extracted) if extracted else None
+
+
+def _extract_datetime_en(text, anchorDate, default_time):
+
     def clean_string(s):
         # normalize and lowercase utt  (replaces words with numbers)
         s = _convert_words_to_numbers_en(s, ordinals=None)
@@ -680,9 +723,6 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 minAbs or secOffset != 0
             )
 
-    if not anchorDate:
-        anchorDate = now_local()
-
     if text == "":
         return None
 
@@ -1445,18 +1485,11 @@ def is_fractional_en(input_str, short_scale=True, spoken=True):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
-    if short_scale:
-        for num in _SHORT_ORDINAL_EN:
-            if num > 2:
-                fracts[_SHORT_ORDINAL_EN[num]] = num
-    else:
-        for num in _LONG_ORDINAL_EN:
-            if num > 2:
-                fracts[_LONG_ORDINAL_EN[num]] = num
-
-    if input_str.lower() in fracts and spoken:
-        return 1.0 / fracts[input_str.lower()]
+    fracts = _SHORT_FRACTION_DENOMINATORS_EN if short_scale \
+        else _LONG_FRACTION_DENOMINATORS_EN
+    denominator = fracts.get(input_str.lower())
+    if denominator and spoken:
+        return 1.0 / denominator
     return False
 
 
@@ -1493,6 +1526,7 @@ class EnglishNormalizer(Normalizer):
         return _convert_words_to_numbers_en(utterance, ordinals=None)
 
 
+@lru_cache(maxsize=2048)
 def normalize_en(text, remove_articles=True):
-    """ English string normalization """
+    """ English string normalization, results are cached per input """
     return EnglishNormalizer().normalize(text, remove_articles)
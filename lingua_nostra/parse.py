@@ -15,14 +15,13 @@
 #
 import re
 from difflib import SequenceMatcher
+from functools import lru_cache
 from warnings import warn
 from lingua_nostra.time import now_local
 from lingua_nostra.internal import populate_localized_function_dict, \
     get_active_langs, get_full_lang_code, get_primary_lang_code, \
     get_default_lang, localized_function, FunctionNotLocalizedError
-from quantulum3 import parser as quantity_parser
 from lingua_nostra.lang.parse_common import ROMAN_NUMERALS
-from quebra_frases import span_indexed_empty_space_tokenize
 
 
 _REGISTERED_FUNCTIONS = ("extract_numbers",
@@ -77,6 +76,8 @@ def extract_roman_numeral_spans(utterance):
                 number in parent utterance [(number, (start_idx, end_idx))]
 
     """
+    # only needed for roman numerals, keep it out of the module import
+    from quebra_frases import span_indexed_empty_space_tokenize
     spans = span_indexed_empty_space_tokenize(utterance)
     return [(roman_to_int(word), (start, end)) for start, end, word in spans
             if is_roman_numeral(word)]
@@ -103,28 +104,23 @@ def normalize_roman_numerals(utterance, ordinals=False, lang=""):
 @localized_function(run_own_code_on=[FunctionNotLocalizedError])
 def extract_quantities(utterance, raw=False, lang=''):
     lang_code = get_primary_lang_code(lang)
-    bucket = []
+    # quantulum3 is slow to import, only load it when quantities are needed
+    from quantulum3 import parser as quantity_parser
     try:
         quants = quantity_parser.parse(utterance, lang=lang_code)
     except NotImplementedError:
         raise FunctionNotLocalizedError
-    remainder = utterance
-    for q in quants:
-        unit = {
-            "value": q.value,
-            "text": q.surface,
-            "span": q.span,
-            "unit": str(q.unit),
-            "uncertainty": q.uncertainty
-        }
-        remainder = remainder[:q.span[0]] + remainder[q.span[1]:]
-        bucket += [unit]
-    if raw:
-        return bucket
-    else:
-        return [(b["value"], b["text"]) for b in bucket]
+    if not raw:
+        # only build the full dicts when they are asked for
+        return [(q.value, q.surface) for q in quants]
+    return [{"value": q.value,
+             "text": q.surface,
+             "span": q.span,
+             "unit": str(q.unit),
+             "uncertainty": q.uncertainty} for q in quants]
 
 
+@lru_cache(maxsize=2048)
 def fuzzy_match(x: str, against: str) -> float:
     """Perform a 'fuzzy' comparison between two strings.
 
@@ -152,12 +148,12 @@ def match_one(query, choices):
         _choices = choices
     else:
         raise ValueError('a list or dict of choices must be provided')
+    if not _choices:
+        raise IndexError('no choices to match against')
 
-    best = (_choices[0], fuzzy_match(query, _choices[0]))
-    for c in _choices[1:]:
-        score = fuzzy_match(query, c)
-        if score > best[1]:
-            best = (c, score)
+    # max keeps the first of equally scored choices
+    best = max(((c, fuzzy_match(query, c)) for c in _choices),
+               key=lambda match: match[1])
 
     if isinstance(choices, dict):
         return (choices[best[0]], best[1])
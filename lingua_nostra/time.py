@@ -13,11 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from datetime import datetime
+from datetime import datetime, timezone
 from dateutil.tz import gettz, tzlocal
 
 
 __default_tz = None
+__system_tz = None
 
 
 def set_default_tz(tz):
@@ -27,6 +28,14 @@ def set_default_tz(tz):
     __default_tz = tz
 
 
+def _system_timezone():
+    """ tzlocal() only reads the OS settings, build it once and reuse it """
+    global __system_tz
+    if __system_tz is None:
+        __system_tz = tzlocal()
+    return __system_tz
+
+
 def default_timezone():
     """ Get the default timezone
 
@@ -37,7 +46,7 @@ def default_timezone():
     Returns:
         (datetime.tzinfo): Definition of the default timezone
     """
-    return __default_tz or tzlocal()
+    return __default_tz or _system_timezone()
 
 
 def now_utc():
@@ -46,7 +55,7 @@ def now_utc():
     Returns:
         (datetime): The current time in Universal Time, aka GMT
     """
-    return datetime.now(gettz("UTC"))
+    return datetime.now(timezone.utc)
 
 
 def now_local(tz=None):
@@ -72,7 +81,7 @@ def now_system():
     Returns:
         (datetime): The current time
     """
-    return datetime.now(tzlocal())
+    return datetime.now(_system_timezone())
 
 
 def to_utc(dt):
@@ -83,7 +92,7 @@ def to_utc(dt):
     Returns:
         (datetime): time converted to UTC
     """
-    tz = gettz("UTC")
+    tz = timezone.utc
     if dt.tzinfo:
         return dt.astimezone(tz)
     else:
@@ -123,7 +132,7 @@ def to_system(dt):
     Returns:
         (datetime): time converted to the operation system's timezone
     """
-    tz = tzlocal()
+    tz = _system_timezone()
     if dt.tzinfo:
         return dt.astimezone(tz)
     else:
@@ -136,13 +145,15 @@ def to_system(dt):
 
 
 def is_leap_year(year):
-    return (year % 400 == 0) or ((year % 4 == 0) and (year % 100 != 0))
+    # test divisibility by 4 first, it rules out 3 of every 4 years
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
 
 
 def get_next_leap_year(year):
-    next_year = year + 1
-    if is_leap_year(next_year):
-        return next_year
-    else:
-        return get_next_leap_year(next_year)
+    # next multiple of 4 strictly after year
+    next_year = year + 4 - (year % 4)
+    # centuries are only leap years when divisible by 400
+    if next_year % 100 == 0 and next_year % 400 != 0:
+        next_year += 4
+    return next_year
 
@@ -15,9 +15,8 @@ def required(requirements_file):
     """ Read requirements file and remove comments and empty lines. """
     with open(os.path.join(os.path.dirname(__file__), requirements_file),
               'r') as f:
-        requirements = f.read().splitlines()
-        return [pkg for pkg in requirements
-                if pkg.strip() and not pkg.startswith("#")]
+        return [pkg for pkg in (line.strip() for line in f)
+                if pkg and not pkg.startswith("#")]
 
 
 extra_files = package_files('lingua_nostra')
@@ -15,6 +15,7 @@
 #
 import unittest
 from datetime import datetime, timedelta
+from functools import lru_cache
 from dateutil import tz
 
 from lingua_nostra.time import now_local, set_default_tz
@@ -31,6 +32,12 @@ from lingua_nostra.parse import normalize
 from lingua_nostra.time import default_timezone
 
 
+@lru_cache(maxsize=None)
+def _expected_datetime(text):
+    """ naive datetime for an expected "%Y-%m-%d %H:%M:%S" string """
+    return datetime.strptime(text, "%Y-%m-%d %H:%M:%S")
+
+
 def setUpModule():
     # TODO spin off English tests
     load_language('en')
@@ -61,6 +68,9 @@ class TestFuzzyMatch(unittest.TestCase):
         choices = {'frank': 1, 'kate': 2, 'harry': 3, 'henry': 4}
         self.assertEqual(match_one('frank', choices)[0], 1)
         self.assertEqual(match_one('enry', choices)[0], 4)
+        # no choices to pick from
+        self.assertRaises(IndexError, match_one, 'frank', [])
+        self.assertRaises(IndexError, match_one, 'frank', {})
 
 
 class TestTimezones(unittest.TestCase):
@@ -166,185 +176,184 @@ class TestNormalize(unittest.TestCase):
                          "this is 1 test")
 
     def test_numbers(self):
-        self.assertEqual(normalize("this is a one two three  test"),
-                         "this is 1 2 3 test")
-        self.assertEqual(normalize("  it's  a four five six  test"),
-                         "it is 4 5 6 test")
-        self.assertEqual(normalize("it's  a seven eight nine test"),
-                         "it is 7 8 9 test")
-        self.assertEqual(normalize("it's a seven eight nine  test"),
-                         "it is 7 8 9 test")
-        self.assertEqual(normalize("that's a ten eleven twelve test"),
-                         "that is 10 11 12 test")
-        self.assertEqual(normalize("that's a thirteen fourteen test"),
-                         "that is 13 14 test")
-        self.assertEqual(normalize("that's fifteen sixteen seventeen"),
-                         "that is 15 16 17")
-        self.assertEqual(normalize("that's eighteen nineteen twenty"),
-                         "that is 18 19 20")
-        self.assertEqual(normalize("that's one nineteen twenty two"),
-                         "that is 1 19 22")
-        self.assertEqual(normalize("that's one hundred"),
-                         "that is 100")
-        self.assertEqual(normalize("that's one two twenty two"),
-                         "that is 1 2 22")
-        self.assertEqual(normalize("that's one and a half"),
-                         "that is 1 and half")
-        self.assertEqual(normalize("that's one and a half and five six"),
-                         "that is 1 and half and 5 6")
+        cases = (
+            ("this is a one two three  test", "this is 1 2 3 test"),
+            ("  it's  a four five six  test", "it is 4 5 6 test"),
+            ("it's  a seven eight nine test", "it is 7 8 9 test"),
+            ("it's a seven eight nine  test", "it is 7 8 9 test"),
+            ("that's a ten eleven twelve test", "that is 10 11 12 test"),
+            ("that's a thirteen fourteen test", "that is 13 14 test"),
+            ("that's fifteen sixteen seventeen", "that is 15 16 17"),
+            ("that's eighteen nineteen twenty", "that is 18 19 20"),
+            ("that's one nineteen twenty two", "that is 1 19 22"),
+            ("that's one hundred", "that is 100"),
+            ("that's one two twenty two", "that is 1 2 22"),
+            ("that's one and a half", "that is 1 and half"),
+            ("that's one and a half and five six",
+             "that is 1 and half and 5 6"),
+        )
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(normalize(text), expected)
 
     def test_contractions(self):
-        self.assertEqual(normalize("ain't"), "is not")
-        self.assertEqual(normalize("aren't"), "are not")
-        self.assertEqual(normalize("can't"), "can not")
-        self.assertEqual(normalize("could've"), "could have")
-        self.assertEqual(normalize("couldn't"), "could not")
-        self.assertEqual(normalize("didn't"), "did not")
-        self.assertEqual(normalize("doesn't"), "does not")
-        self.assertEqual(normalize("don't"), "do not")
-        self.assertEqual(normalize("gonna"), "going to")
-        self.assertEqual(normalize("gotta"), "got to")
-        self.assertEqual(normalize("hadn't"), "had not")
-        self.assertEqual(normalize("hadn't have"), "had not have")
-        self.assertEqual(normalize("hasn't"), "has not")
-        self.assertEqual(normalize("haven't"), "have not")
-        # TODO: Ambiguous with "he had"
-        self.assertEqual(normalize("he'd"), "he would")
-        self.assertEqual(normalize("he'll"), "he will")
-        # TODO: Ambiguous with "he has"
-        self.assertEqual(normalize("he's"), "he is")
-        # TODO: Ambiguous with "how would"
-        self.assertEqual(normalize("how'd"), "how did")
-        self.assertEqual(normalize("how'll"), "how will")
-        # TODO: Ambiguous with "how has" and "how does"
-        self.assertEqual(normalize("how's"), "how is")
-        # TODO: Ambiguous with "I had"
-        self.assertEqual(normalize("I'd"), "I would")
-        self.assertEqual(normalize("I'll"), "I will")
-        self.assertEqual(normalize("I'm"), "I am")
-        self.assertEqual(normalize("I've"), "I have")
-        self.assertEqual(normalize("I haven't"), "I have not")
-        self.assertEqual(normalize("isn't"), "is not")
-        self.assertEqual(normalize("it'd"), "it would")
-        self.assertEqual(normalize("it'll"), "it will")
-        # TODO: Ambiguous with "it has"
-        self.assertEqual(normalize("it's"), "it is")
-        self.assertEqual(normalize("it isn't"), "it is not")
-        self.assertEqual(normalize("mightn't"), "might not")
-        self.assertEqual(normalize("might've"), "might have")
-        self.assertEqual(normalize("mustn't"), "must not")
-        self.assertEqual(normalize("mustn't have"), "must not have")
-        self.assertEqual(normalize("must've"), "must have")
-        self.assertEqual(normalize("needn't"), "need not")
-        self.assertEqual(normalize("oughtn't"), "ought not")
-        self.assertEqual(normalize("shan't"), "shall not")
-        # TODO: Ambiguous wiht "she had"
-        self.assertEqual(normalize("she'd"), "she would")
-        self.assertEqual(normalize("she hadn't"), "she had not")
-        self.assertEqual(normalize("she'll"), "she will")
-        self.assertEqual(normalize("she's"), "she is")
-        self.assertEqual(normalize("she isn't"), "she is not")
-        self.assertEqual(normalize("should've"), "should have")
-        self.assertEqual(normalize("shouldn't"), "should not")
-        self.assertEqual(normalize("shouldn't have"), "should not have")
-        self.assertEqual(normalize("somebody's"), "somebody is")
-        # TODO: Ambiguous with "someone had"
-        self.assertEqual(normalize("someone'd"), "someone would")
-        self.assertEqual(normalize("someone hadn't"), "someone had not")
-        self.assertEqual(normalize("someone'll"), "someone will")
-        # TODO: Ambiguous with "someone has"
-        self.assertEqual(normalize("someone's"), "someone is")
-        self.assertEqual(normalize("that'll"), "that will")
-        # TODO: Ambiguous with "that has"
-        self.assertEqual(normalize("that's"), "that is")
-        # TODO: Ambiguous with "that had"
-        self.assertEqual(normalize("that'd"), "that would")
-        # TODO: Ambiguous with "there had"
-        self.assertEqual(normalize("there'd"), "there would")
-        self.assertEqual(normalize("there're"), "there are")
-        # TODO: Ambiguous with "there has"
-        self.assertEqual(normalize("there's"), "there is")
-        # TODO: Ambiguous with "they had"
-        self.assertEqual(normalize("they'd"), "they would")
-        self.assertEqual(normalize("they'll"), "they will")
-        self.assertEqual(normalize("they won't have"), "they will not have")
-        self.assertEqual(normalize("they're"), "they are")
-        self.assertEqual(normalize("they've"), "they have")
-        self.assertEqual(normalize("they haven't"), "they have not")
-        self.assertEqual(normalize("wasn't"), "was not")
-        # TODO: Ambiguous wiht "we had"
-        self.assertEqual(normalize("we'd"), "we would")
-        self.assertEqual(normalize("we would've"), "we would have")
-        self.assertEqual(normalize("we wouldn't"), "we would not")
-        self.assertEqual(normalize("we wouldn't have"), "we would not have")
-        self.assertEqual(normalize("we'll"), "we will")
-        self.assertEqual(normalize("we won't have"), "we will not have")
-        self.assertEqual(normalize("we're"), "we are")
-        self.assertEqual(normalize("we've"), "we have")
-        self.assertEqual(normalize("weren't"), "were not")
-        self.assertEqual(normalize("what'd"), "what did")
-        self.assertEqual(normalize("what'll"), "what will")
-        self.assertEqual(normalize("what're"), "what are")
-        # TODO: Ambiguous with "what has" / "what does")
-        self.assertEqual(normalize("whats"), "what is")
-        self.assertEqual(normalize("what's"), "what is")
-        self.assertEqual(normalize("what've"), "what have")
-        # TODO: Ambiguous with "when has"
-        self.assertEqual(normalize("when's"), "when is")
-        self.assertEqual(normalize("where'd"), "where did")
-        # TODO: Ambiguous with "where has" / where does"
-        self.assertEqual(normalize("where's"), "where is")
-        self.assertEqual(normalize("where've"), "where have")
-        # TODO: Ambiguous with "who had" "who did")
-        self.assertEqual(normalize("who'd"), "who would")
-        self.assertEqual(normalize("who'd've"), "who would have")
-        self.assertEqual(normalize("who'll"), "who will")
-        self.assertEqual(normalize("who're"), "who are")
-        # TODO: Ambiguous with "who has" / "who does"
-        self.assertEqual(normalize("who's"), "who is")
-        self.assertEqual(normalize("who've"), "who have")
-        self.assertEqual(normalize("why'd"), "why did")
-        self.assertEqual(normalize("why're"), "why are")
-        # TODO: Ambiguous with "why has" / "why does"
-        self.assertEqual(normalize("why's"), "why is")
-        self.assertEqual(normalize("won't"), "will not")
-        self.assertEqual(normalize("won't've"), "will not have")
-        self.assertEqual(normalize("would've"), "would have")
-        self.assertEqual(normalize("wouldn't"), "would not")
-        self.assertEqual(normalize("wouldn't've"), "would not have")
-        self.assertEqual(normalize("ya'll"), "you all")
-        self.assertEqual(normalize("y'all"), "you all")
-        self.assertEqual(normalize("y'ain't"), "you are not")
-        # TODO: Ambiguous with "you had"
-        self.assertEqual(normalize("you'd"), "you would")
-        self.assertEqual(normalize("you'd've"), "you would have")
-        self.assertEqual(normalize("you'll"), "you will")
-        self.assertEqual(normalize("you're"), "you are")
-        self.assertEqual(normalize("you aren't"), "you are not")
-        self.assertEqual(normalize("you've"), "you have")
-        self.assertEqual(normalize("you haven't"), "you have not")
+        cases = (
+            ("ain't", "is not"),
+            ("aren't", "are not"),
+            ("can't", "can not"),
+            ("could've", "could have"),
+            ("couldn't", "could not"),
+            ("didn't", "did not"),
+            ("doesn't", "does not"),
+            ("don't", "do not"),
+            ("gonna", "going to"),
+            ("gotta", "got to"),
+            ("hadn't", "had not"),
+            ("hadn't have", "had not have"),
+            ("hasn't", "has not"),
+            ("haven't", "have not"),
+            # TODO: Ambiguous with "he had"
+            ("he'd", "he would"),
+            ("he'll", "he will"),
+            # TODO: Ambiguous with "he has"
+            ("he's", "he is"),
+            # TODO: Ambiguous with "how would"
+            ("how'd", "how did"),
+            ("how'll", "how will"),
+            # TODO: Ambiguous with "how has" and "how does"
+            ("how's", "how is"),
+            # TODO: Ambiguous with "I had"
+            ("I'd", "I would"),
+            ("I'll", "I will"),
+            ("I'm", "I am"),
+            ("I've", "I have"),
+            ("I haven't", "I have not"),
+            ("isn't", "is not"),
+            ("it'd", "it would"),
+            ("it'll", "it will"),
+            # TODO: Ambiguous with "it has"
+            ("it's", "it is"),
+            ("it isn't", "it is not"),
+            ("mightn't", "might not"),
+            ("might've", "might have"),
+            ("mustn't", "must not"),
+            ("mustn't have", "must not have"),
+            ("must've", "must have"),
+            ("needn't", "need not"),
+            ("oughtn't", "ought not"),
+            ("shan't", "shall not"),
+            # TODO: Ambiguous wiht "she had"
+            ("she'd", "she would"),
+            ("she hadn't", "she had not"),
+            ("she'll", "she will"),
+            ("she's", "she is"),
+            ("she isn't", "she is not"),
+            ("should've", "should have"),
+            ("shouldn't", "should not"),
+            ("shouldn't have", "should not have"),
+            ("somebody's", "somebody is"),
+            # TODO: Ambiguous with "someone had"
+            ("someone'd", "someone would"),
+            ("someone hadn't", "someone had not"),
+            ("someone'll", "someone will"),
+            # TODO: Ambiguous with "someone has"
+            ("someone's", "someone is"),
+            ("that'll", "that will"),
+            # TODO: Ambiguous with "that has"
+            ("that's", "that is"),
+            # TODO: Ambiguous with "that had"
+            ("that'd", "that would"),
+            # TODO: Ambiguous with "there had"
+            ("there'd", "there would"),
+            ("there're", "there are"),
+            # TODO: Ambiguous with "there has"
+            ("there's", "there is"),
+            # TODO: Ambiguous with "they had"
+            ("they'd", "they would"),
+            ("they'll", "they will"),
+            ("they won't have", "they will not have"),
+            ("they're", "they are"),
+            ("they've", "they have"),
+            ("they haven't", "they have not"),
+            ("wasn't", "was not"),
+            # TODO: Ambiguous wiht "we had"
+            ("we'd", "we would"),
+            ("we would've", "we would have"),
+            ("we wouldn't", "we would not"),
+            ("we wouldn't have", "we would not have"),
+            ("we'll", "we will"),
+            ("we won't have", "we will not have"),
+            ("we're", "we are"),
+            ("we've", "we have"),
+            ("weren't", "were not"),
+            ("what'd", "what did"),
+            ("what'll", "what will"),
+            ("what're", "what are"),
+            # TODO: Ambiguous with "what has" / "what does")
+            ("whats", "what is"),
+            ("what's", "what is"),
+            ("what've", "what have"),
+            # TODO: Ambiguous with "when has"
+            ("when's", "when is"),
+            ("where'd", "where did"),
+            # TODO: Ambiguous with "where has" / where does"
+            ("where's", "where is"),
+            ("where've", "where have"),
+            # TODO: Ambiguous with "who had" "who did")
+            ("who'd", "who would"),
+            ("who'd've", "who would have"),
+            ("who'll", "who will"),
+            ("who're", "who are"),
+            # TODO: Ambiguous with "who has" / "who does"
+            ("who's", "who is"),
+            ("who've", "who have"),
+            ("why'd", "why did"),
+            ("why're", "why are"),
+            # TODO: Ambiguous with "why has" / "why does"
+            ("why's", "why is"),
+            ("won't", "will not"),
+            ("won't've", "will not have"),
+            ("would've", "would have"),
+            ("wouldn't", "would not"),
+            ("wouldn't've", "would not have"),
+            ("ya'll", "you all"),
+            ("y'all", "you all"),
+            ("y'ain't", "you are not"),
+            # TODO: Ambiguous with "you had"
+            ("you'd", "you would"),
+            ("you'd've", "you would have"),
+            ("you'll", "you will"),
+            ("you're", "you are"),
+            ("you aren't", "you are not"),
+            ("you've", "you have"),
+            ("you haven't", "you have not"),
+        )
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(normalize(text), expected)
 
     def test_combinations(self):
-        self.assertEqual(normalize("I couldn't have guessed there'd be two"),
-                         "I could not have guessed there would be 2")
-        self.assertEqual(normalize("I wouldn't have"), "I would not have")
-        self.assertEqual(normalize("I hadn't been there"),
-                         "I had not been there")
-        self.assertEqual(normalize("I would've"), "I would have")
-        self.assertEqual(normalize("it hadn't"), "it had not")
-        self.assertEqual(normalize("it hadn't have"), "it had not have")
-        self.assertEqual(normalize("it would've"), "it would have")
-        self.assertEqual(normalize("she wouldn't have"), "she would not have")
-        self.assertEqual(normalize("she would've"), "she would have")
-        self.assertEqual(normalize("someone wouldn't have"),
-                         "someone would not have")
-        self.assertEqual(normalize("someone would've"), "someone would have")
-        self.assertEqual(normalize("what's the weather like"),
-                         "what is weather like")
-        self.assertEqual(normalize("that's what I told you"),
-                         "that is what I told you")
-
-        self.assertEqual(normalize("whats 8 + 4"), "what is 8 + 4")
+        cases = (
+            ("I couldn't have guessed there'd be two",
+             "I could not have guessed there would be 2"),
+            ("I wouldn't have", "I would not have"),
+            ("I hadn't been there", "I had not been there"),
+            ("I would've", "I would have"),
+            ("it hadn't", "it had not"),
+            ("it hadn't have", "it had not have"),
+            ("it would've", "it would have"),
+            ("she wouldn't have", "she would not have"),
+            ("she would've", "she would have"),
+            ("someone wouldn't have", "someone would not have"),
+            ("someone would've", "someone would have"),
+            ("what's the weather like", "what is weather like"),
+            ("that's what I told you", "that is what I told you"),
+
+            ("whats 8 + 4", "what is 8 + 4"),
+        )
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(normalize(text), expected)
 
 
 class TestNumbers(unittest.TestCase):
@@ -652,6 +661,11 @@ class TestDuration(unittest.TestCase):
                          (timedelta(seconds=10.0), ""))
         self.assertEqual(extract_duration("5-minutes"),
                          (timedelta(minutes=5), ""))
+        # a zero duration is no duration
+        self.assertEqual(extract_duration("0 seconds"), (None, ""))
+        # a unit only pairs with the number right before it
+        self.assertEqual(extract_duration("10 7 hours day"),
+                         (timedelta(hours=7), "10  day"))
 
     def test_extract_duration_case_en(self):
         self.assertEqual(extract_duration("Set a timer for 30 minutes"),
@@ -668,384 +682,383 @@ class TestDuration(unittest.TestCase):
 
 
 class TestDatetime(unittest.TestCase):
+    def _check_extract(self, anchor, cases):
+        """ check (text, expected date, expected leftover) cases """
+        for text, expected_date, expected_leftover in cases:
+            with self.subTest(text=text):
+                res = extract_datetime(normalize(text), anchor)
+                # wall clock times are compared, whatever the result's tzinfo
+                self.assertEqual(res[0].replace(tzinfo=None),
+                                 _expected_datetime(expected_date))
+                self.assertEqual(res[1], expected_leftover)
+
     def test_extractdatetime_fractions_en(self):
-        def extractWithFormat(text):
-            date = datetime(2017, 6, 27, 13, 4,
-                            tzinfo=default_timezone())  # Tue June 27, 2017 @ 1:04pm
-            [extractedDate, leftover] = extract_datetime(text, date)
-            extractedDate = extractedDate.strftime("%Y-%m-%d %H:%M:%S")
-            return [extractedDate, leftover]
-
-        def testExtract(text, expected_date, expected_leftover):
-            res = extractWithFormat(normalize(text))
-            self.assertEqual(res[0], expected_date, "for=" + text)
-            self.assertEqual(res[1], expected_leftover, "for=" + text)
-
-        testExtract("Set the ambush for half an hour",
-                    "2017-06-27 13:34:00", "set ambush")
-        testExtract("remind me to call mom in half an hour",
-                    "2017-06-27 13:34:00", "remind me to call mom")
-        testExtract("remind me to call mom in a half hour",
-                    "2017-06-27 13:34:00", "remind me to call mom")
-        testExtract("remind me to call mom in a quarter hour",
-                    "2017-06-27 13:19:00", "remind me to call mom")
-        testExtract("remind me to call mom in a quarter of an hour",
-                    "2017-06-27 13:19:00", "remind me to call mom")
+        date = datetime(2017, 6, 27, 13, 4,
+                        tzinfo=default_timezone())  # Tue June 27, 2017 @ 1:04pm
+
+        cases = (
+            ("Set the ambush for half an hour",
+             "2017-06-27 13:34:00", "set ambush"),
+            ("remind me to call mom in half an hour",
+             "2017-06-27 13:34:00", "remind me to call mom"),
+            ("remind me to call mom in a half hour",
+             "2017-06-27 13:34:00", "remind me to call mom"),
+            ("remind me to call mom in a quarter hour",
+             "2017-06-27 13:19:00", "remind me to call mom"),
+            ("remind me to call mom in a quarter of an hour",
+             "2017-06-27 13:19:00", "remind me to call mom"),
+        )
+        self._check_extract(date, cases)
 
     def test_extractdatetime_en(self):
-        def extractWithFormat(text):
-            date = datetime(2017, 6, 27, 13, 4,
-                            tzinfo=default_timezone())  # Tue June 27, 2017 @ 1:04pm
-            [extractedDate, leftover] = extract_datetime(text, date)
-            extractedDate = extractedDate.strftime("%Y-%m-%d %H:%M:%S")
-            return [extractedDate, leftover]
-
-        def testExtract(text, expected_date, expected_leftover):
-            res = extractWithFormat(normalize(text))
-            self.assertEqual(res[0], expected_date, "for=" + text)
-            self.assertEqual(res[1], expected_leftover, "for=" + text)
-
-        testExtract("now is the time",
-                    "2017-06-27 13:04:00", "is time")
-        testExtract("in a second",
-                    "2017-06-27 13:04:01", "")
-        testExtract("in a minute",
-                    "2017-06-27 13:05:00", "")
-        testExtract("in a couple minutes",
-                    "2017-06-27 13:06:00", "")
-        testExtract("in a couple of minutes",
-                    "2017-06-27 13:06:00", "")
-        testExtract("in a couple hours",
-                    "2017-06-27 15:04:00", "")
-        testExtract("in a couple of hours",
-                    "2017-06-27 15:04:00", "")
-        testExtract("in a couple weeks",
-                    "2017-07-11 00:00:00", "")
-        testExtract("in a couple of weeks",
-                    "2017-07-11 00:00:00", "")
-        testExtract("in a couple months",
-                    "2017-08-27 00:00:00", "")
-        testExtract("in a couple years",
-                    "2019-06-27 00:00:00", "")
-        testExtract("in a couple of months",
-                    "2017-08-27 00:00:00", "")
-        testExtract("in a couple of years",
-                    "2019-06-27 00:00:00", "")
-        testExtract("in a decade",
-                    "2027-06-27 00:00:00", "")
-        testExtract("in a couple of decades",
-                    "2037-06-27 00:00:00", "")
-        testExtract("next decade",
-                    "2027-06-27 00:00:00", "")
-        testExtract("in a century",
-                    "2117-06-27 00:00:00", "")
-        testExtract("in a millennium",
-                    "3017-06-27 00:00:00", "")
-        testExtract("in a couple decades",
-                    "2037-06-27 00:00:00", "")
-        testExtract("in 5 decades",
-                    "2067-06-27 00:00:00", "")
-        testExtract("in a couple centuries",
-                    "2217-06-27 00:00:00", "")
-        testExtract("in a couple of centuries",
-                    "2217-06-27 00:00:00", "")
-        testExtract("in 2 centuries",
-                    "2217-06-27 00:00:00", "")
-        testExtract("in a couple millenniums",
-                    "4017-06-27 00:00:00", "")
-        testExtract("in a couple of millenniums",
-                    "4017-06-27 00:00:00", "")
-        testExtract("in an hour",
-                    "2017-06-27 14:04:00", "")
-        testExtract("i want it within the hour",
-                    "2017-06-27 14:04:00", "i want it")
-        testExtract("in 1 second",
-                    "2017-06-27 13:04:01", "")
-        testExtract("in 2 seconds",
-                    "2017-06-27 13:04:02", "")
-        testExtract("Set the ambush in 1 minute",
-                    "2017-06-27 13:05:00", "set ambush")
-        testExtract("Set the ambush for 5 days from today",
-                    "2017-07-02 00:00:00", "set ambush")
-        testExtract("day after tomorrow",
-                    "2017-06-29 00:00:00", "")
-        testExtract("What is the day after tomorrow's weather?",
-                    "2017-06-29 00:00:00", "what is weather")
-        testExtract("Remind me at 10:45 pm",
-                    "2017-06-27 22:45:00", "remind me")
-        testExtract("what is the weather on friday morning",
-                    "2017-06-30 08:00:00", "what is weather")
-        testExtract("what is tomorrow's weather",
-                    "2017-06-28 00:00:00", "what is weather")
-        testExtract("what is this afternoon's weather",
-                    "2017-06-27 15:00:00", "what is weather")
-        testExtract("what is this evening's weather",
-                    "2017-06-27 19:00:00", "what is weather")
-        testExtract("what was this morning's weather",
-                    "2017-06-27 08:00:00", "what was weather")
-        testExtract("remind me to call mom in 8 weeks and 2 days",
-                    "2017-08-24 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom on august 3rd",
-                    "2017-08-03 00:00:00", "remind me to call mom")
-        testExtract("remind me tomorrow to call mom at 7am",
-                    "2017-06-28 07:00:00", "remind me to call mom")
-        testExtract("remind me tomorrow to call mom at 10pm",
-                    "2017-06-28 22:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 7am",
-                    "2017-06-28 07:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in an hour",
-                    "2017-06-27 14:04:00", "remind me to call mom")
-        testExtract("remind me to call mom at 1730",
-                    "2017-06-27 17:30:00", "remind me to call mom")
-        testExtract("remind me to call mom at 0630",
-                    "2017-06-28 06:30:00", "remind me to call mom")
-        testExtract("remind me to call mom at 06 30 hours",
-                    "2017-06-28 06:30:00", "remind me to call mom")
-        testExtract("remind me to call mom at 06 30",
-                    "2017-06-28 06:30:00", "remind me to call mom")
-        testExtract("remind me to call mom at 06 30 hours",
-                    "2017-06-28 06:30:00", "remind me to call mom")
-        testExtract("remind me to call mom at 7 o'clock",
-                    "2017-06-27 19:00:00", "remind me to call mom")
-        testExtract("remind me to call mom this evening at 7 o'clock",
-                    "2017-06-27 19:00:00", "remind me to call mom")
-        testExtract("remind me to call mom  at 7 o'clock tonight",
-                    "2017-06-27 19:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 7 o'clock in the morning",
-                    "2017-06-28 07:00:00", "remind me to call mom")
-        testExtract("remind me to call mom Thursday evening at 7 o'clock",
-                    "2017-06-29 19:00:00", "remind me to call mom")
-        testExtract("remind me to call mom Thursday morning at 7 o'clock",
-                    "2017-06-29 07:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 7 o'clock Thursday morning",
-                    "2017-06-29 07:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 7:00 Thursday morning",
-                    "2017-06-29 07:00:00", "remind me to call mom")
-        # TODO: This test is imperfect due to the "at 7:00" still in the
-        #       remainder.  But let it pass for now since time is correct
-        testExtract("remind me to call mom at 7:00 Thursday evening",
-                    "2017-06-29 19:00:00", "remind me to call mom at 7:00")
-        testExtract("remind me to call mom at 8 Wednesday evening",
-                    "2017-06-28 20:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 8 Wednesday in the evening",
-                    "2017-06-28 20:00:00", "remind me to call mom")
-        testExtract("remind me to call mom Wednesday evening at 8",
-                    "2017-06-28 20:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in two hours",
-                    "2017-06-27 15:04:00", "remind me to call mom")
-        testExtract("remind me to call mom in 2 hours",
-                    "2017-06-27 15:04:00", "remind me to call mom")
-        testExtract("remind me to call mom in 15 minutes",
-                    "2017-06-27 13:19:00", "remind me to call mom")
-        testExtract("remind me to call mom in fifteen minutes",
-                    "2017-06-27 13:19:00", "remind me to call mom")
-        testExtract("remind me to call mom at 10am 2 days after this saturday",
-                    "2017-07-03 10:00:00", "remind me to call mom")
-        testExtract("Play Rick Astley music 2 days from Friday",
-                    "2017-07-02 00:00:00", "play rick astley music")
-        testExtract("Begin the invasion at 3:45 pm on Thursday",
-                    "2017-06-29 15:45:00", "begin invasion")
-        testExtract("On Monday, order pie from the bakery",
-                    "2017-07-03 00:00:00", "order pie from bakery")
-        testExtract("Play Happy Birthday music 5 years from today",
-                    "2022-06-27 00:00:00", "play happy birthday music")
-        testExtract("Skype Mom at 12:45 pm next Thursday",
-                    "2017-07-06 12:45:00", "skype mom")
-        testExtract("What's the weather next Friday?",
-                    "2017-06-30 00:00:00", "what weather")
-        testExtract("What's the weather next Wednesday?",
-                    "2017-07-05 00:00:00", "what weather")
-        testExtract("What's the weather next Thursday?",
-                    "2017-07-06 00:00:00", "what weather")
-        testExtract("what is the weather next friday morning",
-                    "2017-06-30 08:00:00", "what is weather")
-        testExtract("what is the weather next friday evening",
-                    "2017-06-30 19:00:00", "what is weather")
-        testExtract("what is the weather next friday afternoon",
-                    "2017-06-30 15:00:00", "what is weather")
-        testExtract("remind me to call mom on august 3rd",
-                    "2017-08-03 00:00:00", "remind me to call mom")
-        testExtract("Buy fireworks on the 4th of July",
-                    "2017-07-04 00:00:00", "buy fireworks")
-        testExtract("what is the weather 2 weeks from next friday",
-                    "2017-07-14 00:00:00", "what is weather")
-        testExtract("what is the weather wednesday at 0700 hours",
-                    "2017-06-28 07:00:00", "what is weather")
-        testExtract("set an alarm wednesday at 7 o'clock",
-                    "2017-06-28 07:00:00", "set alarm")
-        testExtract("Set up an appointment at 12:45 pm next Thursday",
-                    "2017-07-06 12:45:00", "set up appointment")
-        testExtract("What's the weather this Thursday?",
-                    "2017-06-29 00:00:00", "what weather")
-        testExtract("set up the visit for 2 weeks and 6 days from Saturday",
-                    "2017-07-21 00:00:00", "set up visit")
-        testExtract("Begin the invasion at 03 45 on Thursday",
-                    "2017-06-29 03:45:00", "begin invasion")
-        testExtract("Begin the invasion at o 800 hours on Thursday",
-                    "2017-06-29 08:00:00", "begin invasion")
-        testExtract("Begin the party at 8 o'clock in the evening on Thursday",
-                    "2017-06-29 20:00:00", "begin party")
-        testExtract("Begin the invasion at 8 in the evening on Thursday",
-                    "2017-06-29 20:00:00", "begin invasion")
-        testExtract("Begin the invasion on Thursday at noon",
-                    "2017-06-29 12:00:00", "begin invasion")
-        testExtract("Begin the invasion on Thursday at midnight",
-                    "2017-06-29 00:00:00", "begin invasion")
-        testExtract("Begin the invasion on Thursday at 0500",
-                    "2017-06-29 05:00:00", "begin invasion")
-        testExtract("remind me to wake up in 4 years",
-                    "2021-06-27 00:00:00", "remind me to wake up")
-        testExtract("remind me to wake up in 4 years and 4 days",
-                    "2021-07-01 00:00:00", "remind me to wake up")
-        testExtract("What is the weather 3 days after tomorrow?",
-                    "2017-07-01 00:00:00", "what is weather")
-        testExtract("december 3",
-                    "2017-12-03 00:00:00", "")
-        testExtract("lets meet at 8:00 tonight",
-                    "2017-06-27 20:00:00", "lets meet")
-        testExtract("lets meet at 5pm",
-                    "2017-06-27 17:00:00", "lets meet")
-        testExtract("lets meet at 8 a.m.",
-                    "2017-06-28 08:00:00", "lets meet")
-        testExtract("remind me to wake up at 8 a.m",
-                    "2017-06-28 08:00:00", "remind me to wake up")
-        testExtract("what is the weather on tuesday",
-                    "2017-06-27 00:00:00", "what is weather")
-        testExtract("what is the weather on monday",
-                    "2017-07-03 00:00:00", "what is weather")
-        testExtract("what is the weather this wednesday",
-                    "2017-06-28 00:00:00", "what is weather")
-        testExtract("on thursday what is the weather",
-                    "2017-06-29 00:00:00", "what is weather")
-        testExtract("on this thursday what is the weather",
-                    "2017-06-29 00:00:00", "what is weather")
-        testExtract("on last monday what was the weather",
-                    "2017-06-26 00:00:00", "what was weather")
-        testExtract("set an alarm for wednesday evening at 8",
-                    "2017-06-28 20:00:00", "set alarm")
-        testExtract("set an alarm for wednesday at 3 o'clock in the afternoon",
-                    "2017-06-28 15:00:00", "set alarm")
-        testExtract("set an alarm for wednesday at 3 o'clock in the morning",
-                    "2017-06-28 03:00:00", "set alarm")
-        testExtract("set an alarm for wednesday morning at 7 o'clock",
-                    "2017-06-28 07:00:00", "set alarm")
-        testExtract("set an alarm for today at 7 o'clock",
-                    "2017-06-27 19:00:00", "set alarm")
-        testExtract("set an alarm for this evening at 7 o'clock",
-                    "2017-06-27 19:00:00", "set alarm")
-        # TODO: This test is imperfect due to the "at 7:00" still in the
-        #       remainder.  But let it pass for now since time is correct
-        testExtract("set an alarm for this evening at 7:00",
-                    "2017-06-27 19:00:00", "set alarm at 7:00")
-        testExtract("on the evening of june 5th 2017 remind me to" +
-                    " call my mother",
-                    "2017-06-05 19:00:00", "remind me to call my mother")
-        # TODO: This test is imperfect due to the missing "for" in the
-        #       remainder.  But let it pass for now since time is correct
-        testExtract("update my calendar for a morning meeting with julius" +
-                    " on march 4th",
-                    "2018-03-04 08:00:00",
-                    "update my calendar meeting with julius")
-        testExtract("remind me to call mom next tuesday",
-                    "2017-07-04 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in 3 weeks",
-                    "2017-07-18 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in 8 weeks",
-                    "2017-08-22 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in 8 weeks and 2 days",
-                    "2017-08-24 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in 4 days",
-                    "2017-07-01 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in 3 months",
-                    "2017-09-27 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom in 2 years and 2 days",
-                    "2019-06-29 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom next week",
-                    "2017-07-04 00:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 10am on saturday",
-                    "2017-07-01 10:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 10am this saturday",
-                    "2017-07-01 10:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 10 next saturday",
-                    "2017-07-01 10:00:00", "remind me to call mom")
-        testExtract("remind me to call mom at 10am next saturday",
-                    "2017-07-01 10:00:00", "remind me to call mom")
-        # test yesterday
-        testExtract("what day was yesterday",
-                    "2017-06-26 00:00:00", "what day was")
-        testExtract("what day was the day before yesterday",
-                    "2017-06-25 00:00:00", "what day was")
-        testExtract("i had dinner yesterday at 6",
-                    "2017-06-26 06:00:00", "i had dinner")
-        testExtract("i had dinner yesterday at 6 am",
-                    "2017-06-26 06:00:00", "i had dinner")
-        testExtract("i had dinner yesterday at 6 pm",
-                    "2017-06-26 18:00:00", "i had dinner")
-
-        # Below two tests, ensure that time is picked
-        # even if no am/pm is specified
-        # in case of weekdays/tonight
-        testExtract("set alarm for 9 on weekdays",
-                    "2017-06-27 21:00:00", "set alarm weekdays")
-        testExtract("for 8 tonight",
-                    "2017-06-27 20:00:00", "")
-        testExtract("for 8:30pm tonight",
-                    "2017-06-27 20:30:00", "")
-        # Tests a time with ':' & without am/pm
-        testExtract("set an alarm for tonight 9:30",
-                    "2017-06-27 21:30:00", "set alarm")
-        testExtract("set an alarm at 9:00 for tonight",
-                    "2017-06-27 21:00:00", "set alarm")
-        # Check if it picks the intent irrespective of correctness
-        testExtract("set an alarm at 9 o'clock for tonight",
-                    "2017-06-27 21:00:00", "set alarm")
-        testExtract("remind me about the game tonight at 11:30",
-                    "2017-06-27 23:30:00", "remind me about game")
-        testExtract("set alarm at 7:30 on weekdays",
-                    "2017-06-27 19:30:00", "set alarm on weekdays")
-
-        #  "# days <from X/after X>"
-        testExtract("my birthday is 2 days from today",
-                    "2017-06-29 00:00:00", "my birthday is")
-        testExtract("my birthday is 2 days after today",
-                    "2017-06-29 00:00:00", "my birthday is")
-        testExtract("my birthday is 2 days from tomorrow",
-                    "2017-06-30 00:00:00", "my birthday is")
-        testExtract("my birthday is 2 days after tomorrow",
-                    "2017-06-30 00:00:00", "my birthday is")
-        testExtract("remind me to call mom at 10am 2 days after next saturday",
-                    "2017-07-10 10:00:00", "remind me to call mom")
-        testExtract("my birthday is 2 days from yesterday",
-                    "2017-06-28 00:00:00", "my birthday is")
-        testExtract("my birthday is 2 days after yesterday",
-                    "2017-06-28 00:00:00", "my birthday is")
-
-        #  "# days ago>"
-        testExtract("my birthday was 1 day ago",
-                    "2017-06-26 00:00:00", "my birthday was")
-        testExtract("my birthday was 2 days ago",
-                    "2017-06-25 00:00:00", "my birthday was")
-        testExtract("my birthday was 3 days ago",
-                    "2017-06-24 00:00:00", "my birthday was")
-        testExtract("my birthday was 4 days ago",
-                    "2017-06-23 00:00:00", "my birthday was")
-        # TODO this test is imperfect due to "tonight" in the reminder, but let is pass since the date is correct
-        testExtract("lets meet tonight",
-                    "2017-06-27 22:00:00", "lets meet tonight")
-        # TODO this test is imperfect due to "at night" in the reminder, but let is pass since the date is correct
-        testExtract("lets meet later at night",
-                    "2017-06-27 22:00:00", "lets meet later at night")
-        # TODO this test is imperfect due to "night" in the reminder, but let is pass since the date is correct
-        testExtract("what's the weather like tomorrow night",
-                    "2017-06-28 22:00:00", "what is weather like night")
-        # TODO this test is imperfect due to "night" in the reminder, but let is pass since the date is correct
-        testExtract("what's the weather like next tuesday night",
-                    "2017-07-04 22:00:00", "what is weather like night")
+        date = datetime(2017, 6, 27, 13, 4,
+                        tzinfo=default_timezone())  # Tue June 27, 2017 @ 1:04pm
+
+        cases = (
+            ("now is the time",
+             "2017-06-27 13:04:00", "is time"),
+            ("in a second",
+             "2017-06-27 13:04:01", ""),
+            ("in a minute",
+             "2017-06-27 13:05:00", ""),
+            ("in a couple minutes",
+             "2017-06-27 13:06:00", ""),
+            ("in a couple of minutes",
+             "2017-06-27 13:06:00", ""),
+            ("in a couple hours",
+             "2017-06-27 15:04:00", ""),
+            ("in a couple of hours",
+             "2017-06-27 15:04:00", ""),
+            ("in a couple weeks",
+             "2017-07-11 00:00:00", ""),
+            ("in a couple of weeks",
+             "2017-07-11 00:00:00", ""),
+            ("in a couple months",
+             "2017-08-27 00:00:00", ""),
+            ("in a couple years",
+             "2019-06-27 00:00:00", ""),
+            ("in a couple of months",
+             "2017-08-27 00:00:00", ""),
+            ("in a couple of years",
+             "2019-06-27 00:00:00", ""),
+            ("in a decade",
+             "2027-06-27 00:00:00", ""),
+            ("in a couple of decades",
+             "2037-06-27 00:00:00", ""),
+            ("next decade",
+             "2027-06-27 00:00:00", ""),
+            ("in a century",
+             "2117-06-27 00:00:00", ""),
+            ("in a millennium",
+             "3017-06-27 00:00:00", ""),
+            ("in a couple decades",
+             "2037-06-27 00:00:00", ""),
+            ("in 5 decades",
+             "2067-06-27 00:00:00", ""),
+            ("in a couple centuries",
+             "2217-06-27 00:00:00", ""),
+            ("in a couple of centuries",
+             "2217-06-27 00:00:00", ""),
+            ("in 2 centuries",
+             "2217-06-27 00:00:00", ""),
+            ("in a couple millenniums",
+             "4017-06-27 00:00:00", ""),
+            ("in a couple of millenniums",
+             "4017-06-27 00:00:00", ""),
+            ("in an hour",
+             "2017-06-27 14:04:00", ""),
+            ("i want it within the hour",
+             "2017-06-27 14:04:00", "i want it"),
+            ("in 1 second",
+             "2017-06-27 13:04:01", ""),
+            ("in 2 seconds",
+             "2017-06-27 13:04:02", ""),
+            ("Set the ambush in 1 minute",
+             "2017-06-27 13:05:00", "set ambush"),
+            ("Set the ambush for 5 days from today",
+             "2017-07-02 00:00:00", "set ambush"),
+            ("day after tomorrow",
+             "2017-06-29 00:00:00", ""),
+            ("What is the day after tomorrow's weather?",
+             "2017-06-29 00:00:00", "what is weather"),
+            ("Remind me at 10:45 pm",
+             "2017-06-27 22:45:00", "remind me"),
+            ("what is the weather on friday morning",
+             "2017-06-30 08:00:00", "what is weather"),
+            ("what is tomorrow's weather",
+             "2017-06-28 00:00:00", "what is weather"),
+            ("what is this afternoon's weather",
+             "2017-06-27 15:00:00", "what is weather"),
+            ("what is this evening's weather",
+             "2017-06-27 19:00:00", "what is weather"),
+            ("what was this morning's weather",
+             "2017-06-27 08:00:00", "what was weather"),
+            ("remind me to call mom in 8 weeks and 2 days",
+             "2017-08-24 00:00:00", "remind me to call mom"),
+            ("remind me to call mom on august 3rd",
+             "2017-08-03 00:00:00", "remind me to call mom"),
+            ("remind me tomorrow to call mom at 7am",
+             "2017-06-28 07:00:00", "remind me to call mom"),
+            ("remind me tomorrow to call mom at 10pm",
+             "2017-06-28 22:00:00", "remind me to call mom"),
+            ("remind me to call mom at 7am",
+             "2017-06-28 07:00:00", "remind me to call mom"),
+            ("remind me to call mom in an hour",
+             "2017-06-27 14:04:00", "remind me to call mom"),
+            ("remind me to call mom at 1730",
+             "2017-06-27 17:30:00", "remind me to call mom"),
+            ("remind me to call mom at 0630",
+             "2017-06-28 06:30:00", "remind me to call mom"),
+            ("remind me to call mom at 06 30 hours",
+             "2017-06-28 06:30:00", "remind me to call mom"),
+            ("remind me to call mom at 06 30",
+             "2017-06-28 06:30:00", "remind me to call mom"),
+            ("remind me to call mom at 06 30 hours",
+             "2017-06-28 06:30:00", "remind me to call mom"),
+            ("remind me to call mom at 7 o'clock",
+             "2017-06-27 19:00:00", "remind me to call mom"),
+            ("remind me to call mom this evening at 7 o'clock",
+             "2017-06-27 19:00:00", "remind me to call mom"),
+            ("remind me to call mom  at 7 o'clock tonight",
+             "2017-06-27 19:00:00", "remind me to call mom"),
+            ("remind me to call mom at 7 o'clock in the morning",
+             "2017-06-28 07:00:00", "remind me to call mom"),
+            ("remind me to call mom Thursday evening at 7 o'clock",
+             "2017-06-29 19:00:00", "remind me to call mom"),
+            ("remind me to call mom Thursday morning at 7 o'clock",
+             "2017-06-29 07:00:00", "remind me to call mom"),
+            ("remind me to call mom at 7 o'clock Thursday morning",
+             "2017-06-29 07:00:00", "remind me to call mom"),
+            ("remind me to call mom at 7:00 Thursday morning",
+             "2017-06-29 07:00:00", "remind me to call mom"),
+            # TODO: This test is imperfect due to the "at 7:00" still in the
+            #       remainder.  But let it pass for now since time is correct
+            ("remind me to call mom at 7:00 Thursday evening",
+             "2017-06-29 19:00:00", "remind me to call mom at 7:00"),
+            ("remind me to call mom at 8 Wednesday evening",
+             "2017-06-28 20:00:00", "remind me to call mom"),
+            ("remind me to call mom at 8 Wednesday in the evening",
+             "2017-06-28 20:00:00", "remind me to call mom"),
+            ("remind me to call mom Wednesday evening at 8",
+             "2017-06-28 20:00:00", "remind me to call mom"),
+            ("remind me to call mom in two hours",
+             "2017-06-27 15:04:00", "remind me to call mom"),
+            ("remind me to call mom in 2 hours",
+             "2017-06-27 15:04:00", "remind me to call mom"),
+            ("remind me to call mom in 15 minutes",
+             "2017-06-27 13:19:00", "remind me to call mom"),
+            ("remind me to call mom in fifteen minutes",
+             "2017-06-27 13:19:00", "remind me to call mom"),
+            ("remind me to call mom at 10am 2 days after this saturday",
+             "2017-07-03 10:00:00", "remind me to call mom"),
+            ("Play Rick Astley music 2 days from Friday",
+             "2017-07-02 00:00:00", "play rick astley music"),
+            ("Begin the invasion at 3:45 pm on Thursday",
+             "2017-06-29 15:45:00", "begin invasion"),
+            ("On Monday, order pie from the bakery",
+             "2017-07-03 00:00:00", "order pie from bakery"),
+            ("Play Happy Birthday music 5 years from today",
+             "2022-06-27 00:00:00", "play happy birthday music"),
+            ("Skype Mom at 12:45 pm next Thursday",
+             "2017-07-06 12:45:00", "skype mom"),
+            ("What's the weather next Friday?",
+             "2017-06-30 00:00:00", "what weather"),
+            ("What's the weather next Wednesday?",
+             "2017-07-05 00:00:00", "what weather"),
+            ("What's the weather next Thursday?",
+             "2017-07-06 00:00:00", "what weather"),
+            ("what is the weather next friday morning",
+             "2017-06-30 08:00:00", "what is weather"),
+            ("what is the weather next friday evening",
+             "2017-06-30 19:00:00", "what is weather"),
+            ("what is the weather next friday afternoon",
+             "2017-06-30 15:00:00", "what is weather"),
+            ("remind me to call mom on august 3rd",
+             "2017-08-03 00:00:00", "remind me to call mom"),
+            ("Buy fireworks on the 4th of July",
+             "2017-07-04 00:00:00", "buy fireworks"),
+            ("what is the weather 2 weeks from next friday",
+             "2017-07-14 00:00:00", "what is weather"),
+            ("what is the weather wednesday at 0700 hours",
+             "2017-06-28 07:00:00", "what is weather"),
+            ("set an alarm wednesday at 7 o'clock",
+             "2017-06-28 07:00:00", "set alarm"),
+            ("Set up an appointment at 12:45 pm next Thursday",
+             "2017-07-06 12:45:00", "set up appointment"),
+            ("What's the weather this Thursday?",
+             "2017-06-29 00:00:00", "what weather"),
+            ("set up the visit for 2 weeks and 6 days from Saturday",
+             "2017-07-21 00:00:00", "set up visit"),
+            ("Begin the invasion at 03 45 on Thursday",
+             "2017-06-29 03:45:00", "begin invasion"),
+            ("Begin the invasion at o 800 hours on Thursday",
+             "2017-06-29 08:00:00", "begin invasion"),
+            ("Begin the party at 8 o'clock in the evening on Thursday",
+             "2017-06-29 20:00:00", "begin party"),
+            ("Begin the invasion at 8 in the evening on Thursday",
+             "2017-06-29 20:00:00", "begin invasion"),
+            ("Begin the invasion on Thursday at noon",
+             "2017-06-29 12:00:00", "begin invasion"),
+            ("Begin the invasion on Thursday at midnight",
+             "2017-06-29 00:00:00", "begin invasion"),
+            ("Begin the invasion on Thursday at 0500",
+             "2017-06-29 05:00:00", "begin invasion"),
+            ("remind me to wake up in 4 years",
+             "2021-06-27 00:00:00", "remind me to wake up"),
+            ("remind me to wake up in 4 years and 4 days",
+             "2021-07-01 00:00:00", "remind me to wake up"),
+            ("What is the weather 3 days after tomorrow?",
+             "2017-07-01 00:00:00", "what is weather"),
+            ("december 3",
+             "2017-12-03 00:00:00", ""),
+            ("lets meet at 8:00 tonight",
+             "2017-06-27 20:00:00", "lets meet"),
+            ("lets meet at 5pm",
+             "2017-06-27 17:00:00", "lets meet"),
+            ("lets meet at 8 a.m.",
+             "2017-06-28 08:00:00", "lets meet"),
+            ("remind me to wake up at 8 a.m",
+             "2017-06-28 08:00:00", "remind me to wake up"),
+            ("what is the weather on tuesday",
+             "2017-06-27 00:00:00", "what is weather"),
+            ("what is the weather on monday",
+             "2017-07-03 00:00:00", "what is weather"),
+            ("what is the weather this wednesday",
+             "2017-06-28 00:00:00", "what is weather"),
+            ("on thursday what is the weather",
+             "2017-06-29 00:00:00", "what is weather"),
+            ("on this thursday what is the weather",
+             "2017-06-29 00:00:00", "what is weather"),
+            ("on last monday what was the weather",
+             "2017-06-26 00:00:00", "what was weather"),
+            ("set an alarm for wednesday evening at 8",
+             "2017-06-28 20:00:00", "set alarm"),
+            ("set an alarm for wednesday at 3 o'clock in the afternoon",
+             "2017-06-28 15:00:00", "set alarm"),
+            ("set an alarm for wednesday at 3 o'clock in the morning",
+             "2017-06-28 03:00:00", "set alarm"),
+            ("set an alarm for wednesday morning at 7 o'clock",
+             "2017-06-28 07:00:00", "set alarm"),
+            ("set an alarm for today at 7 o'clock",
+             "2017-06-27 19:00:00", "set alarm"),
+            ("set an alarm for this evening at 7 o'clock",
+             "2017-06-27 19:00:00", "set alarm"),
+            # TODO: This test is imperfect due to the "at 7:00" still in the
+            #       remainder.  But let it pass for now since time is correct
+            ("set an alarm for this evening at 7:00",
+             "2017-06-27 19:00:00", "set alarm at 7:00"),
+            ("on the evening of june 5th 2017 remind me to" +
+             " call my mother",
+             "2017-06-05 19:00:00", "remind me to call my mother"),
+            # TODO: This test is imperfect due to the missing "for" in the
+            #       remainder.  But let it pass for now since time is correct
+            ("update my calendar for a morning meeting with julius" +
+             " on march 4th",
+             "2018-03-04 08:00:00",
+             "update my calendar meeting with julius"),
+            ("remind me to call mom next tuesday",
+             "2017-07-04 00:00:00", "remind me to call mom"),
+            ("remind me to call mom in 3 weeks",
+             "2017-07-18 00:00:00", "remind me to call mom"),
+            ("remind me to call mom in 8 weeks",
+             "2017-08-22 00:00:00", "remind me to call mom"),
+            ("remind me to call mom in 8 weeks and 2 days",
+             "2017-08-24 00:00:00", "remind me to call mom"),
+            ("remind me to call mom in 4 days",
+             "2017-07-01 00:00:00", "remind me to call mom"),
+            ("remind me to call mom in 3 months",
+             "2017-09-27 00:00:00", "remind me to call mom"),
+            ("remind me to call mom in 2 years and 2 days",
+             "2019-06-29 00:00:00", "remind me to call mom"),
+            ("remind me to call mom next week",
+             "2017-07-04 00:00:00", "remind me to call mom"),
+            ("remind me to call mom at 10am on saturday",
+             "2017-07-01 10:00:00", "remind me to call mom"),
+            ("remind me to call mom at 10am this saturday",
+             "2017-07-01 10:00:00", "remind me to call mom"),
+            ("remind me to call mom at 10 next saturday",
+             "2017-07-01 10:00:00", "remind me to call mom"),
+            ("remind me to call mom at 10am next saturday",
+             "2017-07-01 10:00:00", "remind me to call mom"),
+            # test yesterday
+            ("what day was yesterday",
+             "2017-06-26 00:00:00", "what day was"),
+            ("what day was the day before yesterday",
+             "2017-06-25 00:00:00", "what day was"),
+            ("i had dinner yesterday at 6",
+             "2017-06-26 06:00:00", "i had dinner"),
+            ("i had dinner yesterday at 6 am",
+             "2017-06-26 06:00:00", "i had dinner"),
+            ("i had dinner yesterday at 6 pm",
+             "2017-06-26 18:00:00", "i had dinner"),
+
+            # Below two tests, ensure that time is picked
+            # even if no am/pm is specified
+            # in case of weekdays/tonight
+            ("set alarm for 9 on weekdays",
+             "2017-06-27 21:00:00", "set alarm weekdays"),
+            ("for 8 tonight",
+             "2017-06-27 20:00:00", ""),
+            ("for 8:30pm tonight",
+             "2017-06-27 20:30:00", ""),
+            # Tests a time with ':' & without am/pm
+            ("set an alarm for tonight 9:30",
+             "2017-06-27 21:30:00", "set alarm"),
+            ("set an alarm at 9:00 for tonight",
+             "2017-06-27 21:00:00", "set alarm"),
+            # Check if it picks the intent irrespective of correctness
+            ("set an alarm at 9 o'clock for tonight",
+             "2017-06-27 21:00:00", "set alarm"),
+            ("remind me about the game tonight at 11:30",
+             "2017-06-27 23:30:00", "remind me about game"),
+            ("set alarm at 7:30 on weekdays",
+             "2017-06-27 19:30:00", "set alarm on weekdays"),
+
+            #  "# days <from X/after X>"
+            ("my birthday is 2 days from today",
+             "2017-06-29 00:00:00", "my birthday is"),
+            ("my birthday is 2 days after today",
+             "2017-06-29 00:00:00", "my birthday is"),
+            ("my birthday is 2 days from tomorrow",
+             "2017-06-30 00:00:00", "my birthday is"),
+            ("my birthday is 2 days after tomorrow",
+             "2017-06-30 00:00:00", "my birthday is"),
+            ("remind me to call mom at 10am 2 days after next saturday",
+             "2017-07-10 10:00:00", "remind me to call mom"),
+            ("my birthday is 2 days from yesterday",
+             "2017-06-28 00:00:00", "my birthday is"),
+            ("my birthday is 2 days after yesterday",
+             "2017-06-28 00:00:00", "my birthday is"),
+
+            #  "# days ago>"
+            ("my birthday was 1 day ago",
+             "2017-06-26 00:00:00", "my birthday was"),
+            ("my birthday was 2 days ago",
+             "2017-06-25 00:00:00", "my birthday was"),
+            ("my birthday was 3 days ago",
+             "2017-06-24 00:00:00", "my birthday was"),
+            ("my birthday was 4 days ago",
+             "2017-06-23 00:00:00", "my birthday was"),
+            # TODO this test is imperfect due to "tonight" in the reminder, but let is pass since the date is correct
+            ("lets meet tonight",
+             "2017-06-27 22:00:00", "lets meet tonight"),
+            # TODO this test is imperfect due to "at night" in the reminder, but let is pass since the date is correct
+            ("lets meet later at night",
+             "2017-06-27 22:00:00", "lets meet later at night"),
+            # TODO this test is imperfect due to "night" in the reminder, but let is pass since the date is correct
+            ("what's the weather like tomorrow night",
+             "2017-06-28 22:00:00", "what is weather like night"),
+            # TODO this test is imperfect due to "night" in the reminder, but let is pass since the date is correct
+            ("what's the weather like next tuesday night",
+             "2017-07-04 22:00:00", "what is weather like night"),
+        )
+        self._check_extract(date, cases)
 
     def test_extract_ambiguous_time_en(self):
-        morning = datetime(2017, 6, 27, 8, 1, 2, tzinfo=default_timezone())
-        evening = datetime(2017, 6, 27, 20, 1, 2, tzinfo=default_timezone())
-        noonish = datetime(2017, 6, 27, 12, 1, 2, tzinfo=default_timezone())
+        default_tz = default_timezone()
+        morning = datetime(2017, 6, 27, 8, 1, 2, tzinfo=default_tz)
+        evening = datetime(2017, 6, 27, 20, 1, 2, tzinfo=default_tz)
+        noonish = datetime(2017, 6, 27, 12, 1, 2, tzinfo=default_tz)
         self.assertEqual(
             extract_datetime('feed the fish'), None)
         self.assertEqual(
@@ -1060,70 +1073,78 @@ class TestDatetime(unittest.TestCase):
             extract_datetime(' '), None)
         self.assertEqual(
             extract_datetime('feed fish at 10 o\'clock', morning)[0],
-            datetime(2017, 6, 27, 10, 0, 0, tzinfo=default_timezone()))
+            datetime(2017, 6, 27, 10, 0, 0, tzinfo=default_tz))
         self.assertEqual(
             extract_datetime('feed fish at 10 o\'clock', noonish)[0],
-            datetime(2017, 6, 27, 22, 0, 0, tzinfo=default_timezone()))
+            datetime(2017, 6, 27, 22, 0, 0, tzinfo=default_tz))
         self.assertEqual(
             extract_datetime('feed fish at 10 o\'clock', evening)[0],
-            datetime(2017, 6, 27, 22, 0, 0, tzinfo=default_timezone()))
+            datetime(2017, 6, 27, 22, 0, 0, tzinfo=default_tz))
 
     def test_extract_date_with_may_I_en(self):
-        now = datetime(2019, 7, 4, 8, 1, 2, tzinfo=default_timezone())
-        may_date = datetime(2019, 5, 2, 10, 11, 20, tzinfo=default_timezone())
+        default_tz = default_timezone()
+        now = datetime(2019, 7, 4, 8, 1, 2, tzinfo=default_tz)
+        may_date = datetime(2019, 5, 2, 10, 11, 20, tzinfo=default_tz)
         self.assertEqual(
             extract_datetime('May I know what time it is tomorrow', now)[0],
-            datetime(2019, 7, 5, 0, 0, 0, tzinfo=default_timezone()))
+            datetime(2019, 7, 5, 0, 0, 0, tzinfo=default_tz))
         self.assertEqual(
             extract_datetime('May I when 10 o\'clock is', now)[0],
-            datetime(2019, 7, 4, 10, 0, 0, tzinfo=default_timezone()))
+            datetime(2019, 7, 4, 10, 0, 0, tzinfo=default_tz))
         self.assertEqual(
             extract_datetime('On 24th of may I want a reminder', may_date)[0],
-            datetime(2019, 5, 24, 0, 0, 0, tzinfo=default_timezone()))
+            datetime(2019, 5, 24, 0, 0, 0, tzinfo=default_tz))
 
     def test_extract_relativedatetime_en(self):
-        def extractWithFormat(text):
-            date = datetime(2017, 6, 27, 10, 1, 2, tzinfo=default_timezone())
-            [extractedDate, leftover] = extract_datetime(text, date)
-            extractedDate = extractedDate.strftime("%Y-%m-%d %H:%M:%S")
-            return [extractedDate, leftover]
-
-        def testExtract(text, expected_date, expected_leftover):
-            res = extractWithFormat(normalize(text))
-            self.assertEqual(res[0], expected_date, "for=" + text)
-            self.assertEqual(res[1], expected_leftover, "for=" + text)
-
-        testExtract("lets meet in 5 minutes",
-                    "2017-06-27 10:06:02", "lets meet")
-        testExtract("lets meet in 5minutes",
-                    "2017-06-27 10:06:02", "lets meet")
-        testExtract("lets meet in 5 seconds",
-                    "2017-06-27 10:01:07", "lets meet")
-        testExtract("lets meet in 1 hour",
-                    "2017-06-27 11:01:02", "lets meet")
-        testExtract("lets meet in 2 hours",
-                    "2017-06-27 12:01:02", "lets meet")
-        testExtract("lets meet in 2hours",
-                    "2017-06-27 12:01:02", "lets meet")
-        testExtract("lets meet in 1 minute",
-                    "2017-06-27 10:02:02", "lets meet")
-        testExtract("lets meet in 1 second",
-                    "2017-06-27 10:01:03", "lets meet")
-        testExtract("lets meet in 5seconds",
-                    "2017-06-27 10:01:07", "lets meet")
+        date = datetime(2017, 6, 27, 10, 1, 2, tzinfo=default_timezone())
+
+        cases = (
+            ("lets meet in 5 minutes",
+             "2017-06-27 10:06:02", "lets meet"),
+            ("lets meet in 5minutes",
+             "2017-06-27 10:06:02", "lets meet"),
+            ("lets meet in 5 seconds",
+             "2017-06-27 10:01:07", "lets meet"),
+            ("lets meet in 1 hour",
+             "2017-06-27 11:01:02", "lets meet"),
+            ("lets meet in 2 hours",
+             "2017-06-27 12:01:02", "lets meet"),
+            ("lets meet in 2hours",
+             "2017-06-27 12:01:02", "lets meet"),
+            ("lets meet in 1 minute",
+             "2017-06-27 10:02:02", "lets meet"),
+            ("lets meet in 1 second",
+             "2017-06-27 10:01:03", "lets meet"),
+            ("lets meet in 5seconds",
+             "2017-06-27 10:01:07", "lets meet"),
+        )
+        self._check_extract(date, cases)
 
     def test_extract_date_with_number_words(self):
-        now = datetime(2019, 7, 4, 8, 1, 2, tzinfo=default_timezone())
+        default_tz = default_timezone()
+        now = datetime(2019, 7, 4, 8, 1, 2, tzinfo=default_tz)
         self.assertEqual(
             extract_datetime('What time will it be in 2 minutes', now)[0],
-            datetime(2019, 7, 4, 8, 3, 2, tzinfo=default_timezone()))
+            datetime(2019, 7, 4, 8, 3, 2, tzinfo=default_tz))
         self.assertEqual(
             extract_datetime('What time will it be in two minutes', now)[0],
-            datetime(2019, 7, 4, 8, 3, 2, tzinfo=default_timezone()))
+            datetime(2019, 7, 4, 8, 3, 2, tzinfo=default_tz))
         self.assertEqual(
             extract_datetime('What time will it be in two hundred minutes',
                              now)[0],
-            datetime(2019, 7, 4, 11, 21, 2, tzinfo=default_timezone()))
+            datetime(2019, 7, 4, 11, 21, 2, tzinfo=default_tz))
+
+    def test_extract_datetime_repeated_en(self):
+        default_tz = default_timezone()
+        now = datetime(2017, 6, 27, 13, 4, tzinfo=default_tz)
+        expected = [datetime(2017, 6, 28, 17, 0, tzinfo=default_tz),
+                    "remind me"]
+        first = extract_datetime("remind me tomorrow at 5 pm", now)
+        self.assertEqual(first, expected)
+        # changing a returned result must not leak into later calls
+        first[1] = "changed"
+        self.assertEqual(extract_datetime("remind me tomorrow at 5 pm", now),
+                         expected)
 
 
 class TestGender(unittest.TestCase):